@@ -21,7 +21,9 @@ def _ensure_dependencies() -> None:
     # Load USD dependencies before any imports that require pxr.
     from .axe_usd.dcc.substance_painter import pxr_loader
 
-    if not pxr_loader.load_dependencies(PLUGIN_DIR):
+    if not (
+        pxr_loader.load_dependencies(PLUGIN_DIR) and pxr_loader.verify_pxr_available()
+    ):
         raise ImportError(
             "USD dependencies could not be loaded. "
             "Verify the plugin bundle includes the correct USD binaries."
@@ -0,0 +1,9 @@
+"""Python version compatibility helpers."""
+
+import sys
+
+
+# ``slots=True`` drops the per-instance ``__dict__`` but needs Python 3.10+.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+__all__ = ["DATACLASS_SLOTS"]
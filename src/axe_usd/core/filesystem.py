@@ -1,6 +1,5 @@
 """File system helpers with validation and consistent error wrapping."""
 
-import json
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -13,19 +12,28 @@ class DefaultFileSystem:
 
     @staticmethod
     @contextmanager
-    def _fs_error(msg, **details):
-        """Wrap file system exceptions into FileSystemError."""
+    def _fs_error(msg_template: str, path: Path):
+        """Wrap file system exceptions into FileSystemError.
+
+        The message and details are only formatted when an error is raised.
+        """
+        # json.JSONDecodeError is a ValueError subclass, so json is only
+        # imported by the JSON helpers that need it.
         try:
             yield
-        except (OSError, ValueError, json.JSONDecodeError, TypeError) as exc:
+        except (OSError, ValueError, TypeError) as exc:
             raise FileSystemError(
-                msg,
-                details={**details, "error": str(exc), "type": type(exc).__name__},
+                msg_template.format(path=path),
+                details={
+                    "path": str(path),
+                    "error": str(exc),
+                    "type": type(exc).__name__,
+                },
             ) from exc
 
     def ensure_directory(self, path: Path) -> Path:
         """Create directory if it doesn't exist."""
-        with self._fs_error(f"Failed to create directory: {path}", path=str(path)):
+        with self._fs_error("Failed to create directory: {path}", path):
             path.mkdir(parents=True, exist_ok=True)
             return path
 
@@ -63,18 +71,23 @@ class DefaultFileSystem:
 
     def read_json(self, path: Path) -> Dict[str, Any]:
         """Read JSON file."""
-        with self._fs_error(f"Failed to read JSON from {path}", path=str(path)):
+        import json
+
+        with self._fs_error("Failed to read JSON from {path}", path):
             with path.open("r", encoding="utf-8") as f:
                 return json.load(f)
 
     def write_json(self, path: Path, data: Dict[str, Any]) -> None:
         """Write JSON file."""
-        with self._fs_error(f"Failed to write JSON to {path}", path=str(path)):
+        import json
+
+        with self._fs_error("Failed to write JSON to {path}", path):
             # Ensure parent directory exists
             self.ensure_directory(path.parent)
 
-            with path.open("w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            # Serialize once and write in one call instead of streaming the
+            # encoder's chunks through the file object.
+            path.write_text(json.dumps(data, indent=2), encoding="utf-8")
 
 
 __all__ = ["DefaultFileSystem"]
@@ -1,9 +1,11 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
+from .compat import DATACLASS_SLOTS
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ExportSettings:
     """Configuration for a USD export run.
 
@@ -18,6 +20,8 @@ class ExportSettings:
         texture_format_overrides: Optional per-renderer texture format overrides.
         arnold_displacement_mode: Whether to use bump or true displacement for
                                   Arnold height maps.
+        asset_name: Last prim name of ``primitive_path`` (derived, e.g.
+                    "/Asset" -> "Asset").
     """
 
     usdpreview: bool
@@ -29,9 +33,15 @@ class ExportSettings:
     save_geometry: bool
     texture_format_overrides: Optional[Dict[str, str]] = None
     arnold_displacement_mode: str = "bump"
+    asset_name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen dataclass: derive the field once through object.__setattr__.
+        asset_name = self.primitive_path.strip("/").rpartition("/")[2]
+        object.__setattr__(self, "asset_name", asset_name)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class MaterialBundle:
     """Material name with resolved texture slot paths.
 
@@ -48,7 +58,7 @@ class MaterialBundle:
     udim_slots: Tuple[str, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class PublishPaths:
     """Resolved file system paths for USD publishing.
 
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Union
 
 from .models import PublishPaths
 
@@ -6,7 +7,9 @@ from .models import PublishPaths
 _USD_EXTENSIONS = {".usd", ".usda", ".usdc"}
 
 
-def build_publish_paths(publish_directory: Path, asset_name: str = "") -> PublishPaths:
+def build_publish_paths(
+    publish_directory: Union[str, Path], asset_name: str = ""
+) -> PublishPaths:
     """Build publish paths for an export directory.
 
     Args:
@@ -25,8 +25,9 @@ _TOKEN_SLOTS = [
 ]
 
 # Pre-compile patterns at module load to avoid rebuilding on every call.
+# The raw token is kept so a cheap substring test can skip the regex scan.
 _COMPILED_SLOTS = [
-    (re.compile(rf"(^|[^a-z0-9]){re.escape(token)}([^a-z0-9]|$)"), slot)
+    (token, re.compile(rf"(^|[^a-z0-9]){re.escape(token)}([^a-z0-9]|$)"), slot)
     for token, slot in _TOKEN_SLOTS
 ]
 
@@ -41,7 +42,7 @@ def slot_from_path(path: str) -> Optional[str]:
         Optional[str]: The normalized slot name if matched.
     """
     lower_path = path.lower()
-    for pattern, slot in _COMPILED_SLOTS:
-        if pattern.search(lower_path):
+    for token, pattern, slot in _COMPILED_SLOTS:
+        if token in lower_path and pattern.search(lower_path):
             return slot
     return None
@@ -94,7 +94,6 @@ def parse_textures(
         material_name = _material_name_from_key(key)
         textures: Dict[str, str] = {}
         udim_textures: Dict[str, str] = {}
-        udim_slots: list[str] = []
         mesh_names: Tuple[str, ...] = ()
 
         if mesh_name_map:
@@ -102,25 +101,22 @@ def parse_textures(
             if raw_mesh_names:
                 if isinstance(raw_mesh_names, (str, bytes)):
                     raw_mesh_names = [raw_mesh_names]
-                cleaned: list[str] = []
-                for mesh_name in raw_mesh_names:
-                    mesh_str = str(mesh_name)
-                    if mesh_str and mesh_str not in cleaned:
-                        cleaned.append(mesh_str)
+                # Dict keys keep first-seen order while deduplicating in O(N).
+                cleaned = dict.fromkeys(str(mesh_name) for mesh_name in raw_mesh_names)
+                cleaned.pop("", None)
                 mesh_names = tuple(cleaned)
 
         for path in paths:
-            slot = slot_from_path(str(path))
+            path_str = str(path)
+            slot = slot_from_path(path_str)
             if not slot:
                 logger.debug("Skipping unrecognized texture path: %s", path)
                 continue
-            udim_path = udim_token_path(str(path))
+            udim_path = udim_token_path(path_str)
             if udim_path:
                 udim_textures.setdefault(slot, udim_path)
-                if slot not in udim_slots:
-                    udim_slots.append(slot)
                 continue
-            textures[slot] = str(path)
+            textures[slot] = path_str
 
         if udim_textures:
             textures.update(udim_textures)
@@ -131,7 +127,8 @@ def parse_textures(
                     name=material_name,
                     textures=textures,
                     mesh_names=mesh_names,
-                    udim_slots=tuple(udim_slots),
+                    # Insertion order already records first-seen UDIM slots.
+                    udim_slots=tuple(udim_textures),
                 )
             )
         else:
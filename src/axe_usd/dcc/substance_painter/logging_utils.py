@@ -4,39 +4,63 @@ from __future__ import annotations
 
 import logging
 import sys
+from typing import Optional
 
 
 DEFAULT_BASE_LOGGER_NAME = "axe_usd"
 BASE_LOGGER_NAME = DEFAULT_BASE_LOGGER_NAME
 _HANDLER_NAME = "axe_usd_stdout"
+# Base logger cached by configure_logging for set_base_log_level.
+_BASE_LOGGER: Optional[logging.Logger] = None
+_LOG_FORMAT = "[AxeUSD] %(levelname)s: %(message)s"
+_PLUGIN_FORMATTER = logging.Formatter(_LOG_FORMAT)
+
+
+class _PluginStreamHandler(logging.StreamHandler):
+    """Stream handler that formats plain records without a Formatter pass."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        # Only the plugin's own formatter takes the fast path; tracebacks,
+        # stack info and any other formatter still go through Formatter.
+        if (
+            self.formatter is not _PLUGIN_FORMATTER
+            or record.exc_info
+            or record.stack_info
+        ):
+            return super().format(record)
+        return _LOG_FORMAT % {
+            "levelname": record.levelname,
+            "message": record.getMessage(),
+        }
 
 
 def derive_base_logger_name(module_name: str) -> str:
-    if not module_name:
-        return DEFAULT_BASE_LOGGER_NAME
-    base = module_name.split(".", 1)[0]
-    return base or DEFAULT_BASE_LOGGER_NAME
+    return module_name.partition(".")[0] or DEFAULT_BASE_LOGGER_NAME
 
 
 def _ensure_stdout_handler(base_logger: logging.Logger) -> None:
-    for handler in base_logger.handlers:
+    # The installed handler is tagged with _HANDLER_NAME, so the name check is
+    # the fast path. Unnamed stdout handlers left by an older module version
+    # are still matched by type and stream so lines are not printed twice.
+    handlers = base_logger.handlers
+    if any(handler.name == _HANDLER_NAME for handler in handlers):
+        return
+    for handler in handlers:
         if (
             isinstance(handler, logging.StreamHandler)
             and getattr(handler, "stream", None) is sys.stdout
         ):
             return
 
-    stream_handler = logging.StreamHandler(sys.stdout)
-    stream_handler.setLevel(logging.DEBUG)
-    stream_handler.setFormatter(
-        logging.Formatter("[AxeUSD] %(levelname)s: %(message)s")
-    )
+    # Leave the handler at NOTSET so the base logger's level is the only gate.
+    stream_handler = _PluginStreamHandler(sys.stdout)
+    stream_handler.setFormatter(_PLUGIN_FORMATTER)
     stream_handler.name = _HANDLER_NAME
     base_logger.addHandler(stream_handler)
 
 
 def configure_logging(module_name: str, level: int = logging.DEBUG) -> logging.Logger:
-    global BASE_LOGGER_NAME
+    global BASE_LOGGER_NAME, _BASE_LOGGER
     if BASE_LOGGER_NAME == DEFAULT_BASE_LOGGER_NAME:
         BASE_LOGGER_NAME = derive_base_logger_name(module_name)
 
@@ -44,11 +68,13 @@ def configure_logging(module_name: str, level: int = logging.DEBUG) -> logging.L
     _ensure_stdout_handler(base_logger)
     base_logger.setLevel(level)
     base_logger.propagate = False
+    _BASE_LOGGER = base_logger
     return base_logger
 
 
 def set_base_log_level(level: int) -> None:
-    logging.getLogger(BASE_LOGGER_NAME).setLevel(level)
+    base_logger = _BASE_LOGGER or logging.getLogger(BASE_LOGGER_NAME)
+    base_logger.setLevel(level)
 
 
 __all__ = ["configure_logging", "set_base_log_level"]
@@ -15,8 +15,9 @@ binary compatibility requirements.
 import logging
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Set, Tuple
 
 
 logger = logging.getLogger(__name__)
@@ -25,6 +26,30 @@ logger = logging.getLogger(__name__)
 _dependencies_loaded = False
 # Keep DLL directory handles alive for the process lifetime (Windows).
 _dll_dir_handles = []
+# sys.path entries injected by this module, checked instead of scanning sys.path.
+_injected_paths: Set[str] = set()
+# Cached result of a successful pxr import probe.
+_pxr_available = False
+
+# The interpreter version cannot change within a process.
+_PY_VERSION: Tuple[int, int] = tuple(sys.version_info[:2])
+
+# Map Python (major, minor) to bundled dependency folders
+_DEP_MAP: Dict[Tuple[int, int], str] = {
+    (3, 9): "py39_usd24_5",  # For Substance Painter 10.0 (USD 24.5)
+    (3, 10): "py310_usd24_5",  # For Substance Painter 9.x (USD 24.5)
+    (3, 11): "py311_usd25_5_1",  # For Substance Painter 10.1+ (USD 25.5.1)
+    # For Substance Painter 12.0+ (USD 25.5.1, via PyPI representation)
+    (3, 13): "py313_usd25_5_1",
+}
+
+
+@lru_cache(maxsize=1)
+def _default_plugin_dir() -> Path:
+    """Return the plugin root, resolving this file's location only once."""
+    # This file is in axe_usd/dcc/substance_painter/pxr_loader.py
+    # parents[0] is substance_painter, parents[1] is dcc, parents[2] is axe_usd, parents[3] is plugin root
+    return Path(__file__).resolve().parents[3]
 
 
 def load_dependencies(plugin_dir: Optional[Path] = None) -> bool:
@@ -44,29 +69,17 @@ def load_dependencies(plugin_dir: Optional[Path] = None) -> bool:
 
     # Auto-detect plugin directory if not provided
     if plugin_dir is None:
-        # This file is in axe_usd/dcc/substance_painter/pxr_loader.py
-        # parent is substance_painter, parent.parent is dcc, parent.parent.parent is axe_usd, parent.parent.parent.parent is plugin root
-        plugin_dir = Path(__file__).resolve().parent.parent.parent.parent
-
-    # Detect Python version
-    py_ver = f"{sys.version_info.major}{sys.version_info.minor}"
-
-    # Map Python version to bundled dependency folders
-    dep_map = {
-        "39": "py39_usd24_5",  # For Substance Painter 10.0 (USD 24.5)
-        "310": "py310_usd24_5",  # For Substance Painter 9.x (USD 24.5)
-        "311": "py311_usd25_5_1",  # For Substance Painter 10.1+ (USD 25.5.1)
-        "313": "py313_usd25_5_1",  # For Substance Painter 12.0+ (USD 25.5.1, via PyPI representation)
-    }
-
-    if py_ver not in dep_map:
+        plugin_dir = _default_plugin_dir()
+
+    dep_folder = _DEP_MAP.get(_PY_VERSION)
+    if dep_folder is None:
+        supported = ", ".join(f"{major}.{minor}" for major, minor in _DEP_MAP)
         logger.error(
-            f"Unsupported Python version: {py_ver} (Python {sys.version_info.major}.{sys.version_info.minor}). "
-            f"Supported versions: {', '.join(dep_map.keys())}"
+            f"Unsupported Python version: Python {_PY_VERSION[0]}.{_PY_VERSION[1]}. "
+            f"Supported versions: {supported}"
         )
         return False
 
-    dep_folder = dep_map[py_ver]
     dep_path = plugin_dir / "dependencies" / dep_folder
 
     if not dep_path.exists():
@@ -77,29 +90,62 @@ def load_dependencies(plugin_dir: Optional[Path] = None) -> bool:
         )
         return False
 
-    # Add to sys.path if not already present
+    # Prepend to sys.path so the bundled pxr wins over any site-packages copy.
+    # _injected_paths is lost when this module is re-imported, and another
+    # loader may have added the folder already, so sys.path is checked too.
     dep_path_str = str(dep_path)
-    if dep_path_str not in sys.path:
+    if dep_path_str not in _injected_paths and dep_path_str not in sys.path:
         sys.path.insert(0, dep_path_str)
         logger.info(f"Added USD dependencies to sys.path: {dep_path_str}")
+    _injected_paths.add(dep_path_str)
 
     # Add DLL directories for Windows (Python 3.8+)
     # USD wheels place DLLs under the pxr/ folder, so include both roots.
     if hasattr(os, "add_dll_directory"):
-        for dll_dir in (dep_path, dep_path / "pxr"):
-            dll_dir_str = str(dll_dir)
-            if not dll_dir.exists():
-                continue
+        # dep_path is known to exist; only the pxr/ folder needs a check.
+        pxr_dir_str = os.path.join(dep_path_str, "pxr")
+        dll_dirs = (dep_path_str,)
+        if os.path.isdir(pxr_dir_str):
+            dll_dirs += (pxr_dir_str,)
+        for dll_dir_str in dll_dirs:
             try:
-                _dll_dir_handles.append(os.add_dll_directory(dll_dir_str))
-                logger.debug(f"Added DLL directory: {dll_dir_str}")
+                handle = os.add_dll_directory(dll_dir_str)
             except Exception as e:
                 logger.warning(f"Failed to add DLL directory '{dll_dir_str}': {e}")
+                continue
+            _dll_dir_handles.append(handle)
+            logger.debug(f"Added DLL directory: {dll_dir_str}")
 
     _dependencies_loaded = True
-    logger.info(f"Successfully loaded USD dependencies for Python {py_ver}")
+    logger.info(
+        f"Successfully loaded USD dependencies for Python {_PY_VERSION[0]}.{_PY_VERSION[1]}"
+    )
+
+    return True
+
+
+def verify_pxr_available() -> bool:
+    """Check that the pxr package is importable.
+
+    A successful probe is cached so repeated checks are a flag lookup.
+    Failures are not cached, so a later ``load_dependencies`` call can fix
+    them. The check never changes sys.path.
 
+    Returns:
+        bool: True if pxr can be imported.
+    """
+    global _pxr_available
+
+    if _pxr_available:
+        return True
+    if sys.modules.get("pxr") is None:
+        try:
+            import pxr  # noqa: F401
+        except ImportError as e:
+            logger.error(f"Failed to import pxr module: {e}")
+            return False
+    _pxr_available = True
     return True
 
 
-__all__ = ["load_dependencies"]
+__all__ = ["load_dependencies", "verify_pxr_available"]
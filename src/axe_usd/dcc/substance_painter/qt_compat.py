@@ -42,6 +42,7 @@ QLabel = QtWidgets.QLabel
 QLineEdit = QtWidgets.QLineEdit
 QMessageBox = QtWidgets.QMessageBox
 QMenuBar = QtWidgets.QMenuBar
+QProgressDialog = QtWidgets.QProgressDialog
 QPushButton = QtWidgets.QPushButton
 QToolButton = QtWidgets.QToolButton
 QInputDialog = QtWidgets.QInputDialog
@@ -71,6 +72,7 @@ __all__ = [
     "QLineEdit",
     "QMessageBox",
     "QMenuBar",
+    "QProgressDialog",
     "QPushButton",
     "QToolButton",
     "QInputDialog",
@@ -3,12 +3,24 @@
 Copyright Ahmed Hindy. Please mention the author if you found any part of this code useful.
 """
 
-import gc
+import errno
 import logging
 import os
 import shutil
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Mapping, Optional, Protocol, Sequence, Tuple
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+)
+
+from pxr import Usd
 
 from ...core.exporter import export_publish
 from ...core.exceptions import (
@@ -31,7 +43,7 @@ from ...usd.pxr_writer import PxrUsdWriter
 
 from . import usd_scene_fixup
 from .logging_utils import configure_logging, set_base_log_level
-from .qt_compat import QMessageBox
+from .qt_compat import QMessageBox, QProgressDialog, Qt
 from .ui import LOG_LEVELS, USDExporterView
 import substance_painter.application
 import substance_painter.event
@@ -53,16 +65,39 @@ USD_PREVIEW_RESOLUTION_LOG2 = {
     2048: 11,
     4096: 12,
 }
+_TRUTHY_ENV_VALUES = frozenset(("1", "true", "yes", "on"))
 PREVIEW_TEXTURE_DIRNAME = "previewTextures"
 PREVIEW_EXPORT_PRESET = "AxeUSDPreview"
 PREVIEW_EXPORT_PRESET_UDIM = "AxeUSDPreviewUDIM"
+PREVIEW_BASECOLOR_FILENAME = "$textureSet_BaseColor"
+PREVIEW_BASECOLOR_FILENAME_UDIM = "$textureSet_BaseColor.$udim"
+# Scalar map parameters shared by the preview presets; each preset copies them.
+_PREVIEW_MAP_PARAMETERS = {
+    "bitDepth": "8",
+    "dithering": False,
+    "paddingAlgorithm": "diffusion",
+    "dilationDistance": 16,
+}
 
-# Hold references to UI widgets
-plugin_widgets = []
+# Hold a reference to the dock widget
 usd_exported_qdialog = None
 callbacks_registered = False
 
 
+def _select_mesh_export_option():
+    """Pick the mesh export option, issuing as few scene queries as possible.
+
+    Tessellation takes precedence, so the triangulation query is skipped when
+    the scene is tessellated.
+    """
+    options = substance_painter.export.MeshExportOption
+    if substance_painter.export.scene_has_tessellation():
+        return options.TessellationNormalsBaseMesh
+    if substance_painter.export.scene_is_triangulated():
+        return options.BaseMesh
+    return options.TriangulatedMesh
+
+
 class MeshExporter:
     """
     Exports mesh geometry to USD if requested.
@@ -75,10 +110,9 @@ class MeshExporter:
             settings: Export settings for determining output paths.
             skip_postprocess: Skip fixup/conversion and leave raw export untouched.
         """
-        # Extract asset name from settings (e.g. primitive_path="/Asset" -> "Asset")
-        asset_name = settings.primitive_path.strip("/").split("/")[-1]
-
-        publish_paths = build_publish_paths(settings.publish_directory, asset_name)
+        publish_paths = build_publish_paths(
+            settings.publish_directory, settings.asset_name
+        )
         self.mesh_path = publish_paths.geometry_path
         self.root_prim_path = DEFAULT_PRIMITIVE_PATH
         self.skip_postprocess = skip_postprocess
@@ -92,7 +126,6 @@ class MeshExporter:
         """
         self.mesh_path.parent.mkdir(parents=True, exist_ok=True)
         logger.info("Exporting mesh to %s", self.mesh_path)
-        logger.debug("Mesh export target suffix: %s", self.mesh_path.suffix)
         export_path = self.mesh_path
         convert_to_usdc = False
         if self.mesh_path.suffix.lower() == ".usdc":
@@ -103,14 +136,7 @@ class MeshExporter:
                 export_path,
             )
 
-        # Choose an export option to use
-        export_option = substance_painter.export.MeshExportOption.BaseMesh
-        if not substance_painter.export.scene_is_triangulated():
-            export_option = substance_painter.export.MeshExportOption.TriangulatedMesh
-        if substance_painter.export.scene_has_tessellation():
-            export_option = (
-                substance_painter.export.MeshExportOption.TessellationNormalsBaseMesh
-            )
+        export_option = _select_mesh_export_option()
 
         try:
             export_result = substance_painter.export.export_mesh(
@@ -131,7 +157,7 @@ class MeshExporter:
                 export_result.status,
                 export_result.message,
             )
-            if not export_path.exists():
+            if not export_path.is_file():
                 raise GeometryExportError(
                     "Mesh export reported success but file is missing.",
                     details={"path": str(export_path)},
@@ -140,32 +166,11 @@ class MeshExporter:
                 logger.info("Skipping mesh fixup/conversion for testing.")
                 return export_path
             if convert_to_usdc:
-                from pxr import Usd
-
-                stage = Usd.Stage.Open(str(export_path))
-                if not stage:
-                    raise USDStageError(
-                        "Failed to open temporary mesh for conversion.",
-                        details={"path": str(export_path)},
-                    )
-                usd_scene_fixup.fix_sp_mesh_stage(stage, self.root_prim_path)
-                stage.GetRootLayer().Export(str(self.mesh_path))
-                if not self.mesh_path.exists():
-                    raise GeometryExportError(
-                        "Mesh conversion reported success but file is missing.",
-                        details={"path": str(self.mesh_path)},
-                    )
-                stage = None
-                gc.collect()
-                if export_path.exists():
-                    try:
-                        export_path.unlink()
-                    except Exception as cleanup_exc:
-                        logger.warning(
-                            "Failed to remove temporary mesh file %s: %s",
-                            export_path,
-                            cleanup_exc,
-                        )
+                try:
+                    self._convert_to_usdc(export_path)
+                finally:
+                    # Also clean up when the conversion fails part way.
+                    self._remove_temporary_mesh(export_path)
             return self.mesh_path
         except AxeUSDError as exc:
             self.last_error = exc.message
@@ -179,19 +184,54 @@ class MeshExporter:
             logger.error("Mesh export failed: %s", exc)
             return None
 
+    @staticmethod
+    def _remove_temporary_mesh(export_path: Path) -> None:
+        try:
+            export_path.unlink(missing_ok=True)
+        except OSError as cleanup_exc:
+            logger.warning(
+                "Failed to remove temporary mesh file %s: %s",
+                export_path,
+                cleanup_exc,
+            )
+
+    def _convert_to_usdc(self, export_path: Path) -> None:
+        """Fix up the temporary mesh layer and write it to ``self.mesh_path``.
+
+        The stage only lives in this frame, so it is released on return and
+        the temporary file can be removed without a full garbage collection.
+
+        The temporary file is read once and the fixed stage is written once;
+        an in-memory copy of the layer would not save either pass.
+
+        Args:
+            export_path: Temporary ``.usd`` file written by Substance Painter.
+        """
+        stage = Usd.Stage.Open(str(export_path))
+        if not stage:
+            raise USDStageError(
+                "Failed to open temporary mesh for conversion.",
+                details={"path": str(export_path)},
+            )
+        usd_scene_fixup.fix_sp_mesh_stage(stage, self.root_prim_path)
+        # Sdf.Layer.Export reports success itself; no need to stat the file.
+        if not stage.GetRootLayer().Export(str(self.mesh_path)):
+            raise GeometryExportError(
+                "Mesh conversion failed to write the .usdc file.",
+                details={"path": str(self.mesh_path)},
+            )
+
 
 def _collect_texture_set_names(
     textures: Mapping[Tuple[str, str], Sequence[str]],
 ) -> Sequence[str]:
-    names: list[str] = []
-    for key in textures.keys():
-        if isinstance(key, (tuple, list)) and key:
-            name = str(key[0])
-        else:
-            name = str(key)
-        if name and name not in names:
-            names.append(name)
-    return names
+    # dict.fromkeys keeps first-seen order with O(1) duplicate checks.
+    names = dict.fromkeys(
+        str(key[0]) if isinstance(key, (tuple, list)) and key else str(key)
+        for key in textures
+    )
+    names.pop("", None)
+    return list(names)
 
 
 def _collect_mesh_name_map(
@@ -221,11 +261,10 @@ def _collect_mesh_name_map(
                 "Failed to read mesh names for texture set %s: %s", set_name, exc
             )
             mesh_names = []
-        cleaned: list[str] = []
-        for mesh_name in mesh_names or []:
-            mesh_str = str(mesh_name)
-            if mesh_str and mesh_str not in cleaned:
-                cleaned.append(mesh_str)
+        # dict.fromkeys keeps first-seen order with O(1) duplicate checks.
+        unique_names = dict.fromkeys(str(mesh_name) for mesh_name in mesh_names or ())
+        unique_names.pop("", None)
+        cleaned = list(unique_names)
         if set_name:
             assignments[set_name] = cleaned
             logger.debug("Texture set '%s' assigned to meshes: %s", set_name, cleaned)
@@ -252,96 +291,75 @@ def _build_export_settings(
     )
 
 
-def _build_preview_export_config(
-    preview_dir: Path,
-    texture_sets: Sequence[str],
-    resolution: int,
-    preview_format: PreviewTextureFormat,
-    udim_texture_sets: Optional[Sequence[str]] = None,
+def _preview_export_preset(
+    name: str, file_name: str, file_format: str, size_log2: int
 ) -> Dict[str, object]:
-    udim_set = {name for name in (udim_texture_sets or []) if name}
-    export_list = []
-    for name in texture_sets:
-        preset = (
-            PREVIEW_EXPORT_PRESET_UDIM if name in udim_set else PREVIEW_EXPORT_PRESET
-        )
-        export_list.append({"rootPath": name, "exportPreset": preset})
-    size_log2 = _resolve_preview_resolution_log2(resolution)
-    export_preset = {
-        "name": PREVIEW_EXPORT_PRESET,
+    """Build a BaseColor-only export preset.
+
+    Every nested dict is created here, so a caller mutating one export config
+    never changes another.
+    """
+    channels = [
+        {
+            "destChannel": channel,
+            "srcChannel": channel,
+            "srcMapType": "documentMap",
+            "srcMapName": "baseColor",
+        }
+        for channel in ("R", "G", "B")
+    ]
+    return {
+        "name": name,
         "maps": [
             {
-                "fileName": "$textureSet_BaseColor",
-                "channels": [
-                    {
-                        "destChannel": "R",
-                        "srcChannel": "R",
-                        "srcMapType": "documentMap",
-                        "srcMapName": "baseColor",
-                    },
-                    {
-                        "destChannel": "G",
-                        "srcChannel": "G",
-                        "srcMapType": "documentMap",
-                        "srcMapName": "baseColor",
-                    },
-                    {
-                        "destChannel": "B",
-                        "srcChannel": "B",
-                        "srcMapType": "documentMap",
-                        "srcMapName": "baseColor",
-                    },
-                ],
+                "fileName": file_name,
+                "channels": channels,
                 "parameters": {
-                    "fileFormat": preview_format.substance_file_format,
-                    "bitDepth": "8",
-                    "dithering": False,
+                    **_PREVIEW_MAP_PARAMETERS,
+                    "fileFormat": file_format,
                     "sizeLog2": size_log2,
-                    "paddingAlgorithm": "diffusion",
-                    "dilationDistance": 16,
                 },
             }
         ],
     }
-    export_presets = [export_preset]
+
+
+def _build_preview_export_config(
+    preview_dir: Path,
+    texture_sets: Sequence[str],
+    resolution: int,
+    preview_format: PreviewTextureFormat,
+    udim_texture_sets: Optional[Sequence[str]] = None,
+) -> Dict[str, object]:
+    udim_set = frozenset(name for name in (udim_texture_sets or ()) if name)
+    # dict.fromkeys drops repeated texture sets while keeping their order.
+    export_list = [
+        {
+            "rootPath": name,
+            "exportPreset": (
+                PREVIEW_EXPORT_PRESET_UDIM
+                if name in udim_set
+                else PREVIEW_EXPORT_PRESET
+            ),
+        }
+        for name in dict.fromkeys(texture_sets)
+        if name
+    ]
+    size_log2 = _resolve_preview_resolution_log2(resolution)
+    file_format = preview_format.substance_file_format
+    export_presets = [
+        _preview_export_preset(
+            PREVIEW_EXPORT_PRESET, PREVIEW_BASECOLOR_FILENAME, file_format, size_log2
+        )
+    ]
     if udim_set:
         export_presets.append(
-            {
-                "name": PREVIEW_EXPORT_PRESET_UDIM,
-                "maps": [
-                    {
-                        "fileName": "$textureSet_BaseColor.$udim",
-                        "channels": [
-                            {
-                                "destChannel": "R",
-                                "srcChannel": "R",
-                                "srcMapType": "documentMap",
-                                "srcMapName": "baseColor",
-                            },
-                            {
-                                "destChannel": "G",
-                                "srcChannel": "G",
-                                "srcMapType": "documentMap",
-                                "srcMapName": "baseColor",
-                            },
-                            {
-                                "destChannel": "B",
-                                "srcChannel": "B",
-                                "srcMapType": "documentMap",
-                                "srcMapName": "baseColor",
-                            },
-                        ],
-                        "parameters": {
-                            "fileFormat": preview_format.substance_file_format,
-                            "bitDepth": "8",
-                            "dithering": False,
-                            "sizeLog2": size_log2,
-                            "paddingAlgorithm": "diffusion",
-                            "dilationDistance": 16,
-                        },
-                    }
-                ],
-            }
+            _preview_export_preset(
+                PREVIEW_EXPORT_PRESET_UDIM,
+                PREVIEW_BASECOLOR_FILENAME_UDIM,
+                file_format,
+                size_log2,
+            )
         )
     return {
         "exportPath": str(preview_dir),
@@ -376,7 +394,7 @@ def _export_usdpreview_textures(
     if not texture_sets:
         raise ValidationError("UsdPreview export failed: no texture sets found.")
 
-    textures_dir.mkdir(parents=True, exist_ok=True)
+    # parents=True also creates textures_dir, so one call covers both folders.
     preview_dir = textures_dir / PREVIEW_TEXTURE_DIRNAME
     preview_dir.mkdir(parents=True, exist_ok=True)
     export_config = _build_preview_export_config(
@@ -420,59 +438,91 @@ def _export_usdpreview_textures(
         )
 
 
+def _replace_file(src: Path, dest: Path) -> None:
+    """Move ``src`` over ``dest``, falling back to a copy across devices."""
+    try:
+        os.replace(src, dest)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        # Cross-device: copy2 overwrites dest using the platform fast-copy
+        # path (sendfile/CopyFileEx) and keeps the mtime used for collisions.
+        shutil.copy2(src, dest)
+        src.unlink()
+
+
+def _move_texture(src: Path, dest: Path, src_mtime: float) -> None:
+    """Move ``src`` to ``dest`` unless ``dest`` is already newer.
+
+    ``src_mtime`` comes from the caller's existence check, so ``src`` is not
+    stat'ed again here.
+    """
+    try:
+        dest_mtime = dest.stat().st_mtime
+    except FileNotFoundError:
+        _replace_file(src, dest)
+        return
+    if dest_mtime < src_mtime:
+        _replace_file(src, dest)
+    else:
+        src.unlink()
+
+
 def _move_exported_textures(
     textures: Mapping[Tuple[str, str], Sequence[str]], textures_dir: Path
 ) -> Mapping[Tuple[str, str], Sequence[str]]:
     textures_dir.mkdir(parents=True, exist_ok=True)
-    updated: dict[Tuple[str, str], list[str]] = {}
-    for key, paths in textures.items():
-        new_paths: list[str] = []
-        for path in paths:
-            if not path:
-                continue
-            src = Path(path)
-            if not src.exists():
-                raise ValidationError(
-                    "Exported texture file missing.",
-                    details={"path": str(src)},
-                )
-            if src.parent == textures_dir:
-                new_paths.append(str(src))
-                continue
+    # Texture sets can share an exported map; move each source path once.
+    seen: dict[str, str] = {}
+
+    def _place(path: str) -> str:
+        moved = seen.get(path)
+        if moved is not None:
+            return moved
+        src = Path(path)
+        # Only the source stat maps to a missing texture; errors from the
+        # move itself propagate with their own path.
+        try:
+            src_mtime = src.stat().st_mtime
+        except FileNotFoundError:
+            raise ValidationError(
+                "Exported texture file missing.",
+                details={"path": str(src)},
+            ) from None
+        if src.parent == textures_dir:
+            moved = str(src)
+        else:
             dest = textures_dir / src.name
-            if dest.exists():
-                if dest.stat().st_mtime < src.stat().st_mtime:
-                    dest.unlink()
-                    shutil.move(str(src), str(dest))
-                else:
-                    src.unlink()
-            else:
-                shutil.move(str(src), str(dest))
-            new_paths.append(str(dest))
-        updated[key] = new_paths
-    return updated
+            _move_texture(src, dest, src_mtime)
+            moved = str(dest)
+        seen[path] = moved
+        return moved
+
+    return {
+        key: [_place(path) for path in paths if path] for key, paths in textures.items()
+    }
 
 
 def _is_preview_export_context(context: "ExportContext") -> bool:
-    texture_paths = [
-        Path(path) for paths in context.textures.values() for path in paths if path
-    ]
-    if not texture_paths:
-        return False
-    preview_token = PREVIEW_TEXTURE_DIRNAME.lower()
-    for path in texture_paths:
-        try:
-            parts = path.parts
-        except Exception:
-            return False
-        if not any(part.lower() == preview_token for part in parts):
-            return False
-    return True
+    # Single pass over plain strings: stop at the first path outside a
+    # preview folder. A "/previewtextures/" substring check on the
+    # normalised path avoids splitting it into a list of parts.
+    preview_token = f"/{PREVIEW_TEXTURE_DIRNAME.lower()}/"
+    found = False
+    for paths in context.textures.values():
+        for path in paths:
+            if not path:
+                continue
+            normalized = "/" + os.fspath(path).replace("\\", "/").lower()
+            if preview_token not in normalized:
+                return False
+            found = True
+    return found
 
 
 def _env_flag(name: str) -> bool:
     value = os.getenv(name, "")
-    return value.strip().lower() in {"1", "true", "yes", "on"}
+    return value.strip().lower() in _TRUTHY_ENV_VALUES
 
 
 # Entry-point functions required by Substance Painter
@@ -495,7 +545,6 @@ def start_plugin() -> None:
     global usd_exported_qdialog
     usd_exported_qdialog = USDExporterView()
     substance_painter.ui.add_dock_widget(usd_exported_qdialog)
-    plugin_widgets.append(usd_exported_qdialog)
     register_callbacks()
 
 
@@ -518,7 +567,14 @@ def _verify_export_context(context: ExportContext) -> Path:
     if not context.textures:
         raise ValidationError("No textures were exported.")
 
-    empty_sets = [key for key, paths in context.textures.items() if not paths]
+    # One pass finds both the empty texture sets and the first exported file.
+    empty_sets = []
+    first_path = None
+    for key, paths in context.textures.items():
+        if not paths:
+            empty_sets.append(key)
+        elif first_path is None:
+            first_path = paths[0]
     if empty_sets:
         empty_names = _collect_texture_set_names({key: [] for key in empty_sets})
         raise ValidationError(
@@ -526,7 +582,6 @@ def _verify_export_context(context: ExportContext) -> Path:
             details={"texture_sets": empty_names},
         )
 
-    first_path = next((paths[0] for paths in context.textures.values() if paths), None)
     if not first_path:
         raise ValidationError("No exported texture files found.")
     return Path(first_path).parent
@@ -555,13 +610,52 @@ def _handle_mesh_export_only(
             details={"message": mesh_exporter.last_error},
         )
     if usd_exported_qdialog is not None:
-        QMessageBox.information(
-            usd_exported_qdialog,
+        usd_exported_qdialog.show_message(
+            QMessageBox.Information,
             "USD Exporter",
             f"Mesh export complete.\n\nMesh file:\n{geo_file}",
         )
 
 
+@contextmanager
+def _export_progress(parent, steps: int) -> Iterator[Callable[[str], None]]:
+    """Show a modal progress dialog for the publish phases.
+
+    Substance Painter's Python API must be called from the main thread, so the
+    publish runs there. Updating a modal QProgressDialog between phases lets
+    Qt repaint and report progress instead of leaving the UI frozen until the
+    whole publish finishes. ``setValue`` processes pending events, so the
+    dialog is application modal to keep user input out of the publish, and it
+    is deleted on exit rather than left hidden under the long-lived dock.
+
+    Args:
+        parent: Parent widget for the dialog.
+        steps: Number of phases that will be reported.
+
+    Yields:
+        Callable[[str], None]: Advances the dialog to the next phase label.
+    """
+    dialog = QProgressDialog("Publishing USD asset...", "", 0, steps, parent)
+    dialog.setWindowTitle("USD Exporter")
+    dialog.setCancelButton(None)
+    dialog.setWindowModality(Qt.ApplicationModal)
+    dialog.setMinimumDuration(0)
+    step = 0
+
+    def advance(label: str) -> None:
+        nonlocal step
+        logger.debug("Publish phase %d/%d: %s", step + 1, steps, label)
+        dialog.setLabelText(label)
+        dialog.setValue(step)
+        step += 1
+
+    try:
+        yield advance
+    finally:
+        dialog.close()
+        dialog.deleteLater()
+
+
 def on_post_export(context: ExportContext) -> None:
     """Handle the texture export completion event.
 
@@ -589,35 +683,7 @@ def on_post_export(context: ExportContext) -> None:
             _handle_mesh_export_only(raw, primitive_path, publish_dir)
             return
 
-        asset_name = primitive_path.strip("/").split("/")[-1]
-        textures_dir = export_dir / asset_name / "textures"
-        textures = _move_exported_textures(context.textures, textures_dir)
-
-        texture_sets = _collect_texture_set_names(textures)
-        mesh_name_map = _collect_mesh_name_map(texture_sets)
-        materials = parse_textures(textures, mesh_name_map=mesh_name_map)
-
-        if not materials:
-            raise ValidationError("No recognized textures were found.")
-
-        udim_texture_sets = tuple(
-            sorted({bundle.name for bundle in materials if bundle.udim_slots})
-        )
-
         texture_overrides = dict(raw.texture_format_overrides or {})
-        preview_format = parse_preview_texture_format(
-            texture_overrides.get("usd_preview")
-        )
-
-        if raw.usdpreview:
-            _export_usdpreview_textures(
-                textures_dir,
-                texture_sets,
-                raw.usdpreview_resolution,
-                preview_format,
-                udim_texture_sets=udim_texture_sets,
-            )
-
         settings = _build_export_settings(
             raw,
             primitive_path,
@@ -626,17 +692,51 @@ def on_post_export(context: ExportContext) -> None:
             texture_overrides=texture_overrides or None,
         )
 
-        geo_file = None
-        if settings.save_geometry:
-            mesh_exporter = MeshExporter(settings)
-            geo_file = mesh_exporter.export_mesh()
-            if geo_file is None:
-                raise GeometryExportError(
-                    "Mesh export failed.",
-                    details={"message": mesh_exporter.last_error},
+        steps = 3 + bool(raw.usdpreview) + bool(settings.save_geometry)
+        with _export_progress(usd_exported_qdialog, steps) as advance:
+            advance("Moving exported textures...")
+            textures_dir = export_dir / settings.asset_name / "textures"
+            textures = _move_exported_textures(context.textures, textures_dir)
+
+            advance("Reading texture sets...")
+            texture_sets = _collect_texture_set_names(textures)
+            mesh_name_map = _collect_mesh_name_map(texture_sets)
+            materials = parse_textures(textures, mesh_name_map=mesh_name_map)
+
+            if not materials:
+                raise ValidationError("No recognized textures were found.")
+
+            udim_texture_sets = tuple(
+                sorted({bundle.name for bundle in materials if bundle.udim_slots})
+            )
+
+            preview_format = parse_preview_texture_format(
+                texture_overrides.get("usd_preview")
+            )
+
+            if raw.usdpreview:
+                advance("Baking USD Preview textures...")
+                _export_usdpreview_textures(
+                    textures_dir,
+                    texture_sets,
+                    raw.usdpreview_resolution,
+                    preview_format,
+                    udim_texture_sets=udim_texture_sets,
                 )
 
-        export_publish(materials, settings, geo_file, PxrUsdWriter())
+            geo_file = None
+            if settings.save_geometry:
+                advance("Exporting mesh...")
+                mesh_exporter = MeshExporter(settings)
+                geo_file = mesh_exporter.export_mesh()
+                if geo_file is None:
+                    raise GeometryExportError(
+                        "Mesh export failed.",
+                        details={"message": mesh_exporter.last_error},
+                    )
+
+            advance("Writing USD layers...")
+            export_publish(materials, settings, geo_file, PxrUsdWriter())
 
     except AxeUSDError as exc:
         logger.error("USD export failed: %s", exc.message)
@@ -644,8 +744,8 @@ def on_post_export(context: ExportContext) -> None:
             logger.error("USD export details: %s", exc.details)
         if usd_exported_qdialog is not None:
             detail = f"\n\nDetails: {exc.details}" if exc.details else ""
-            QMessageBox.critical(
-                usd_exported_qdialog,
+            usd_exported_qdialog.show_message(
+                QMessageBox.Critical,
                 "USD Exporter",
                 f"USD export failed:\n{exc.message}{detail}",
             )
@@ -653,22 +753,22 @@ def on_post_export(context: ExportContext) -> None:
     except Exception as exc:
         logger.exception("USD export failed: %s", exc)
         if usd_exported_qdialog is not None:
-            QMessageBox.critical(
-                usd_exported_qdialog,
+            usd_exported_qdialog.show_message(
+                QMessageBox.Critical,
                 "USD Exporter",
                 f"USD export failed:\n{exc}\n\nCheck the logs for more details.",
             )
         return
 
-    QMessageBox.information(
-        usd_exported_qdialog,
+    usd_exported_qdialog.show_message(
+        QMessageBox.Information,
         "USD Exporter",
         f"USD export complete.\n\nPublish folder:\n{settings.publish_directory}",
     )
 
 
 def close_plugin() -> None:
-    """Remove all widgets that have been added to the UI."""
+    """Remove the exporter dock widget and disconnect the export callback."""
     logger.info("Closing plugin.")
     global callbacks_registered, usd_exported_qdialog
     if callbacks_registered:
@@ -679,7 +779,6 @@ def close_plugin() -> None:
         except Exception as e:
             logger.warning("close_plugin() failed to disconnect event handler: %s", e)
         callbacks_registered = False
-    for widget in plugin_widgets:
-        substance_painter.ui.delete_ui_element(widget)
-    plugin_widgets.clear()
+    if usd_exported_qdialog is not None:
+        substance_painter.ui.delete_ui_element(usd_exported_qdialog)
     usd_exported_qdialog = None
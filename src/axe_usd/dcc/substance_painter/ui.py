@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict
 
+from ...core.compat import DATACLASS_SLOTS
 from ...version import get_version
 from .qt_compat import (
     QCheckBox,
@@ -46,7 +47,7 @@ LOG_LEVELS = {
 }
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class USDSettings:
     """
     USD export options container.
@@ -89,6 +90,7 @@ class USDExporterView(QDialog):
         self._plugin_version = get_version()
         self._log_level_actions = {}
         self._log_level_name = "Debug"
+        self._message_boxes = {}
 
         self._setup_window()
         self._build_ui()
@@ -137,17 +139,15 @@ class USDExporterView(QDialog):
         advanced_menu = menu_bar.addMenu("Advanced")
         log_menu = advanced_menu.addMenu("Log Level")
 
-        for level_name in LOG_LEVELS.keys():
+        for level_name in LOG_LEVELS:
             action = log_menu.addAction(level_name)
             action.setCheckable(True)
+            action.setChecked(level_name == self._log_level_name)
             action.triggered.connect(
                 lambda _checked, name=level_name: self._set_log_level(name)
             )
             self._log_level_actions[level_name] = action
 
-        for name, action in self._log_level_actions.items():
-            action.setChecked(name == self._log_level_name)
-
         root_layout.setMenuBar(menu_bar)
 
     def _build_header(self, root_layout: QVBoxLayout):
@@ -311,6 +311,29 @@ class USDExporterView(QDialog):
         self.override_usdpreview.setCurrentIndex(0)
         self.usdpreview_resolution.setCurrentText("128")
 
+    def show_message(self, icon, title: str, text: str) -> None:
+        """Show a modal message box, reusing one instance per icon.
+
+        The first QMessageBox built in a session pays for style polishing;
+        later messages with the same icon reuse that box.
+
+        Args:
+            icon: QMessageBox icon (e.g. ``QMessageBox.Critical``).
+            title: Window title.
+            text: Message text (rich text is allowed).
+        """
+        box = self._message_boxes.get(icon)
+        if box is None:
+            box = QMessageBox(self)
+            box.setIcon(icon)
+            box.setStandardButtons(QMessageBox.Ok)
+            self._message_boxes[icon] = box
+        box.setWindowTitle(title)
+        box.setText(text)
+        # PySide6 names the modal loop exec(); PySide2 only has exec_().
+        run_modal = getattr(box, "exec", None) or box.exec_
+        run_modal()
+
     def _show_help(self) -> None:
         """Show a short help dialog."""
         message = (
@@ -319,7 +342,7 @@ class USDExporterView(QDialog):
             "<p>2. Run the Substance Painter export process.</p>"
             "<p>3. The plugin will automatically generate USD files in the export directory.</p>"
         )
-        QMessageBox.information(self, "Axe USD Exporter Help", message)
+        self.show_message(QMessageBox.Information, "Axe USD Exporter Help", message)
 
     def _open_docs(self) -> None:
         """Open the local user guide if available."""
@@ -330,8 +353,8 @@ class USDExporterView(QDialog):
         if docs_path.exists():
             QDesktopServices.openUrl(QUrl.fromLocalFile(str(docs_path)))
         else:
-            QMessageBox.warning(
-                self,
+            self.show_message(
+                QMessageBox.Warning,
                 "Docs Not Found",
                 "Local documentation was not found in this install.",
             )
@@ -348,7 +371,7 @@ class USDExporterView(QDialog):
             "<li>MaterialX</li>"
             "</ul>"
         )
-        QMessageBox.information(self, "About Axe USD Exporter", message)
+        self.show_message(QMessageBox.Information, "About Axe USD Exporter", message)
 
     def get_settings(self) -> USDSettings:
         """
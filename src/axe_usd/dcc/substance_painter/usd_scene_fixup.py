@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import logging
-from typing import List, Optional
+from typing import Optional
 
-from pxr import Gf, Sdf, Usd, UsdGeom
+from pxr import Sdf, Usd, UsdGeom, Vt
 
 from ...core.exceptions import USDStageError, ValidationError
 
@@ -28,7 +28,7 @@ def _detect_source_root(stage: Usd.Stage) -> Usd.Prim:
     raise USDStageError("Ambiguous root prims; cannot auto-detect.", details=details)
 
 
-def _compute_mesh_extent(mesh: UsdGeom.Mesh) -> Optional[List[Gf.Vec3f]]:
+def _compute_mesh_extent(mesh: UsdGeom.Mesh) -> Optional[Vt.Vec3fArray]:
     points_attr = mesh.GetPointsAttr()
     if not points_attr:
         return None
@@ -36,13 +36,9 @@ def _compute_mesh_extent(mesh: UsdGeom.Mesh) -> Optional[List[Gf.Vec3f]]:
     if not points:
         return None
 
-    min_x = min(point[0] for point in points)
-    min_y = min(point[1] for point in points)
-    min_z = min(point[2] for point in points)
-    max_x = max(point[0] for point in points)
-    max_y = max(point[1] for point in points)
-    max_z = max(point[2] for point in points)
-    return [Gf.Vec3f(min_x, min_y, min_z), Gf.Vec3f(max_x, max_y, max_z)]
+    # Computed in C++ in one pass, instead of six Python passes over the
+    # points array, which dominated conversion time on dense meshes.
+    return UsdGeom.PointBased.ComputeExtent(points)
 
 
 def _author_mesh_extents(stage: Usd.Stage, render_root: Sdf.Path) -> int:
@@ -59,11 +59,9 @@ def create_asset_file_structure(
     """
     fs = DefaultFileSystem()
 
-    # Create asset root directory
+    # Asset root plus textures directory for maps (handled elsewhere); the
+    # root is created as a parent of the textures directory.
     asset_root = output_dir / asset_name
-    fs.ensure_directory(asset_root)
-
-    # Create textures directory for maps (handled elsewhere)
     textures_dir = asset_root / "textures"
     fs.ensure_directory(textures_dir)
 
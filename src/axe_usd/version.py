@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from importlib import metadata
 
 from ._project_version import read_project_version
 
 
+@lru_cache(maxsize=1)
 def get_version() -> str:
-    """Return the plugin version string with safe fallbacks."""
+    """Return the plugin version string with safe fallbacks.
+
+    The result is cached, so opening the export dialog again does not repeat
+    the metadata scan or the pyproject.toml read.
+    """
     try:
         from . import _version  # type: ignore
 
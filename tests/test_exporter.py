@@ -1,5 +1,8 @@
+from dataclasses import replace
 from pathlib import Path
 
+import pytest
+
 from axe_usd.core.exporter import export_publish
 from axe_usd.core.models import ExportSettings, MaterialBundle
 
@@ -51,3 +54,28 @@ def test_export_publish_calls_writer():
     assert writer.paths == paths
     assert paths.root_dir == Path("publish")
     assert writer.materials[0].name == "Mat"
+
+
+@pytest.mark.parametrize(
+    ("primitive_path", "expected"),
+    [
+        ("/Asset", "Asset"),
+        ("/Scene/Asset/", "Asset"),
+        ("Asset", "Asset"),
+        ("/", ""),
+    ],
+)
+def test_export_settings_derives_asset_name(primitive_path, expected):
+    """ExportSettings exposes the last prim name of its primitive path."""
+    settings = ExportSettings(
+        usdpreview=True,
+        arnold=False,
+        materialx=False,
+        openpbr=False,
+        primitive_path=primitive_path,
+        publish_directory=Path("publish"),
+        save_geometry=False,
+    )
+
+    assert settings.asset_name == expected
+    assert replace(settings, primitive_path="/Other").asset_name == "Other"
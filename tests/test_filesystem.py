@@ -142,6 +142,8 @@ class TestDefaultFileSystem:
 
         assert "Failed to read JSON" in exc_info.value.message
         assert str(missing) in exc_info.value.message
+        assert exc_info.value.details["path"] == str(missing)
+        assert exc_info.value.details["type"] == "FileNotFoundError"
 
     def test_read_json_raises_on_invalid_json(self, tmp_path):
         """read_json raises FileSystemError for invalid JSON."""
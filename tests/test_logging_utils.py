@@ -0,0 +1,110 @@
+import io
+import logging
+import sys
+
+import pytest
+
+from axe_usd.dcc.substance_painter import logging_utils
+
+
+def _make_handler():
+    stream = io.StringIO()
+    handler = logging_utils._PluginStreamHandler(stream)
+    handler.setFormatter(logging_utils._PLUGIN_FORMATTER)
+    return handler, stream
+
+
+def _make_record(msg, args=(), exc_info=None):
+    return logging.LogRecord(
+        "axe_usd.test", logging.WARNING, __file__, 1, msg, args, exc_info
+    )
+
+
+def test_plugin_stream_handler_matches_formatter_layout():
+    """The fast path produces the same text as the configured Formatter."""
+    handler, _stream = _make_handler()
+    record = _make_record("Exported %d textures", (3,))
+
+    expected = logging.Formatter(logging_utils._LOG_FORMAT).format(record)
+
+    assert handler.format(record) == expected
+    assert expected == "[AxeUSD] WARNING: Exported 3 textures"
+
+
+def test_plugin_stream_handler_keeps_tracebacks():
+    """Records with exception info still include the traceback."""
+    handler, stream = _make_handler()
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        record = _make_record("Export failed", exc_info=sys.exc_info())
+
+    handler.emit(record)
+
+    output = stream.getvalue()
+    assert output.startswith("[AxeUSD] WARNING: Export failed")
+    assert "RuntimeError: boom" in output
+
+
+def test_plugin_stream_handler_honours_custom_formatter():
+    """A formatter installed with setFormatter replaces the plugin layout."""
+    handler, _stream = _make_handler()
+    handler.setFormatter(logging.Formatter("%(name)s | %(message)s"))
+    record = _make_record("Exported %d textures", (3,))
+
+    assert handler.format(record) == "axe_usd.test | Exported 3 textures"
+
+
+def test_set_base_log_level_uses_configured_logger(monkeypatch):
+    """set_base_log_level updates the logger returned by configure_logging."""
+    monkeypatch.setattr(logging_utils, "BASE_LOGGER_NAME", "axe_usd_test_base")
+    monkeypatch.setattr(logging_utils, "_BASE_LOGGER", None)
+
+    base_logger = logging_utils.configure_logging("axe_usd_test_base.plugin")
+    logging_utils.set_base_log_level(logging.ERROR)
+
+    assert base_logger.name == "axe_usd_test_base"
+    assert base_logger.level == logging.ERROR
+    assert logging.getLogger("axe_usd_test_base").level == logging.ERROR
+
+
+@pytest.mark.parametrize(
+    ("module_name", "expected"),
+    [
+        ("axe_usd_plugin.axe_usd.dcc", "axe_usd_plugin"),
+        ("standalone", "standalone"),
+        ("", logging_utils.DEFAULT_BASE_LOGGER_NAME),
+        (".relative", logging_utils.DEFAULT_BASE_LOGGER_NAME),
+    ],
+)
+def test_derive_base_logger_name(module_name, expected):
+    """The base logger is the top-level package of the module name."""
+    assert logging_utils.derive_base_logger_name(module_name) == expected
+
+
+def test_stdout_handler_leaves_filtering_to_logger():
+    """The installed stdout handler does not add a second level check."""
+    base_logger = logging.getLogger("axe_usd_test_handler")
+    base_logger.handlers.clear()
+
+    logging_utils._ensure_stdout_handler(base_logger)
+    logging_utils._ensure_stdout_handler(base_logger)
+
+    (handler,) = base_logger.handlers
+    assert handler.level == logging.NOTSET
+    base_logger.handlers.clear()
+
+
+def test_stdout_handler_reuses_unnamed_stdout_handler(monkeypatch):
+    """A stdout handler installed without the plugin name is not duplicated."""
+    stream = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", stream)
+    base_logger = logging.getLogger("axe_usd_test_legacy_handler")
+    base_logger.handlers.clear()
+    legacy = logging.StreamHandler(sys.stdout)
+    base_logger.addHandler(legacy)
+
+    logging_utils._ensure_stdout_handler(base_logger)
+
+    assert base_logger.handlers == [legacy]
+    base_logger.handlers.clear()
@@ -15,3 +15,16 @@ def test_build_publish_paths_from_file():
     """Verify path building when given a main layer file path."""
     paths = build_publish_paths(Path("publish/main.usda"))
     assert paths.root_dir == Path("publish")
+
+
+def test_build_publish_paths_from_string_file():
+    """Verify string inputs with upper-case USD extensions are handled."""
+    paths = build_publish_paths("publish/Main.USDC", asset_name="Asset")
+    assert paths.root_dir == Path("publish")
+    assert paths.geometry_path == Path("publish/Asset/geo.usdc")
+
+
+def test_build_publish_paths_uses_path_suffix_rules():
+    """Trailing separators and bare dotfile names follow ``Path.suffix``."""
+    assert build_publish_paths("publish/main.usd/").root_dir == Path("publish")
+    assert build_publish_paths("publish/.usd").root_dir == Path("publish/.usd")
@@ -0,0 +1,134 @@
+import importlib
+import sys
+
+import pytest
+
+from axe_usd.dcc.substance_painter import pxr_loader
+
+
+@pytest.fixture
+def fresh_loader(monkeypatch):
+    """Reset pxr_loader state and restore sys.path after each test."""
+    monkeypatch.setattr(pxr_loader, "_dependencies_loaded", False)
+    monkeypatch.setattr(pxr_loader, "_injected_paths", set())
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    return pxr_loader
+
+
+def _make_dep_dir(plugin_dir, folder):
+    dep_path = plugin_dir / "dependencies" / folder
+    (dep_path / "pxr").mkdir(parents=True)
+    return dep_path
+
+
+def test_load_dependencies_prepends_bundled_path(fresh_loader, monkeypatch, tmp_path):
+    """The bundled dependency folder is placed at the front of sys.path."""
+    monkeypatch.setitem(fresh_loader._DEP_MAP, fresh_loader._PY_VERSION, "py_test")
+    dep_path = _make_dep_dir(tmp_path, "py_test")
+
+    assert fresh_loader.load_dependencies(tmp_path) is True
+    assert sys.path[0] == str(dep_path)
+
+
+def test_load_dependencies_does_not_duplicate_path(fresh_loader, monkeypatch, tmp_path):
+    """Repeated loads only inject the dependency folder once."""
+    monkeypatch.setitem(fresh_loader._DEP_MAP, fresh_loader._PY_VERSION, "py_test")
+    dep_path = _make_dep_dir(tmp_path, "py_test")
+
+    fresh_loader.load_dependencies(tmp_path)
+    fresh_loader._dependencies_loaded = False
+    fresh_loader.load_dependencies(tmp_path)
+
+    assert sys.path.count(str(dep_path)) == 1
+
+
+def test_load_dependencies_survives_module_reload(fresh_loader, monkeypatch, tmp_path):
+    """A re-imported loader does not add the dependency folder a second time."""
+    monkeypatch.setitem(fresh_loader._DEP_MAP, fresh_loader._PY_VERSION, "py_test")
+    dep_path = _make_dep_dir(tmp_path, "py_test")
+
+    fresh_loader.load_dependencies(tmp_path)
+    package = sys.modules[fresh_loader.__name__.rpartition(".")[0]]
+    monkeypatch.setattr(package, "pxr_loader", fresh_loader)
+    monkeypatch.delitem(sys.modules, fresh_loader.__name__)
+    reloaded = importlib.import_module(fresh_loader.__name__)
+    monkeypatch.setitem(reloaded._DEP_MAP, reloaded._PY_VERSION, "py_test")
+    reloaded.load_dependencies(tmp_path)
+
+    assert reloaded is not fresh_loader
+    assert sys.path.count(str(dep_path)) == 1
+
+
+def test_load_dependencies_rejects_unsupported_python(fresh_loader, monkeypatch):
+    """Unsupported interpreter versions fail without touching sys.path."""
+    monkeypatch.setattr(fresh_loader, "_PY_VERSION", (2, 7))
+    before = list(sys.path)
+
+    assert fresh_loader.load_dependencies() is False
+    assert sys.path == before
+
+
+def test_load_dependencies_reports_missing_folder(fresh_loader, monkeypatch, tmp_path):
+    """A missing dependency folder is reported as a failed load."""
+    monkeypatch.setitem(fresh_loader._DEP_MAP, fresh_loader._PY_VERSION, "py_missing")
+
+    assert fresh_loader.load_dependencies(tmp_path) is False
+
+
+def test_verify_pxr_available_caches_success(fresh_loader, monkeypatch):
+    """A successful pxr probe is cached for later checks."""
+    monkeypatch.setattr(fresh_loader, "_pxr_available", False)
+    monkeypatch.setitem(sys.modules, "pxr", object())
+
+    assert fresh_loader.verify_pxr_available() is True
+    monkeypatch.delitem(sys.modules, "pxr")
+    assert fresh_loader.verify_pxr_available() is True
+
+
+def test_verify_pxr_available_reports_missing_pxr(fresh_loader, monkeypatch):
+    """A failed pxr import returns False and is not cached."""
+    monkeypatch.setattr(fresh_loader, "_pxr_available", False)
+    monkeypatch.setitem(sys.modules, "pxr", None)
+
+    assert fresh_loader.verify_pxr_available() is False
+    assert fresh_loader._pxr_available is False
+
+
+def test_load_dependencies_registers_dll_directories(
+    fresh_loader, monkeypatch, tmp_path
+):
+    """Both the dependency root and its pxr/ folder are added as DLL dirs."""
+    monkeypatch.setitem(fresh_loader._DEP_MAP, fresh_loader._PY_VERSION, "py_test")
+    monkeypatch.setattr(fresh_loader, "_dll_dir_handles", [])
+    added = []
+    monkeypatch.setattr(
+        fresh_loader.os, "add_dll_directory", added.append, raising=False
+    )
+    dep_path = _make_dep_dir(tmp_path, "py_test")
+
+    assert fresh_loader.load_dependencies(tmp_path) is True
+    assert added == [str(dep_path), str(dep_path / "pxr")]
+
+
+def test_verify_pxr_available_leaves_sys_path_alone(
+    fresh_loader, monkeypatch, tmp_path
+):
+    """Verifying pxr keeps the injected dependency folder on sys.path."""
+    monkeypatch.setitem(fresh_loader._DEP_MAP, fresh_loader._PY_VERSION, "py_test")
+    monkeypatch.setattr(fresh_loader, "_pxr_available", False)
+    monkeypatch.setitem(sys.modules, "pxr", object())
+    dep_path = _make_dep_dir(tmp_path, "py_test")
+
+    fresh_loader.load_dependencies(tmp_path)
+    before = list(sys.path)
+
+    assert fresh_loader.verify_pxr_available() is True
+    assert sys.path == before
+    assert sys.path[0] == str(dep_path)
+
+
+def test_default_plugin_dir_is_package_parent():
+    """The default plugin root is the folder that contains axe_usd/."""
+    plugin_dir = pxr_loader._default_plugin_dir()
+
+    assert (plugin_dir / "axe_usd" / "dcc" / "substance_painter").is_dir()
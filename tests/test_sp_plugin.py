@@ -0,0 +1,616 @@
+from pathlib import Path
+import errno
+import os
+import sys
+import types
+
+import pytest
+
+from axe_usd.core.exceptions import ValidationError
+
+
+def _install_qt_stub() -> None:
+    if "axe_usd.dcc.substance_painter.qt_compat" in sys.modules:
+        return
+
+    qt_stub = types.ModuleType("axe_usd.dcc.substance_painter.qt_compat")
+
+    def _stub_class(name: str):
+        return type(name, (), {})
+
+    qt_stub.Qt = types.SimpleNamespace(AlignTop=0, AlignLeft=0, AlignVCenter=0)
+    for name in (
+        "QCheckBox",
+        "QComboBox",
+        "QDialog",
+        "QFormLayout",
+        "QFrame",
+        "QGroupBox",
+        "QHBoxLayout",
+        "QLabel",
+        "QMessageBox",
+        "QMenuBar",
+        "QProgressDialog",
+        "QPushButton",
+        "QScrollArea",
+        "QVBoxLayout",
+        "QWidget",
+        "QDesktopServices",
+        "QIcon",
+        "QUrl",
+    ):
+        setattr(qt_stub, name, _stub_class(name))
+
+    sys.modules["axe_usd.dcc.substance_painter.qt_compat"] = qt_stub
+
+
+def _install_sp_stub() -> None:
+    if "substance_painter" in sys.modules:
+        return
+
+    sp_stub = types.ModuleType("substance_painter")
+    sp_stub.application = types.ModuleType("substance_painter.application")
+    sp_stub.event = types.ModuleType("substance_painter.event")
+    sp_stub.export = types.ModuleType("substance_painter.export")
+    sp_stub.textureset = types.ModuleType("substance_painter.textureset")
+    sp_stub.ui = types.ModuleType("substance_painter.ui")
+
+    sys.modules["substance_painter"] = sp_stub
+    sys.modules["substance_painter.application"] = sp_stub.application
+    sys.modules["substance_painter.event"] = sp_stub.event
+    sys.modules["substance_painter.export"] = sp_stub.export
+    sys.modules["substance_painter.textureset"] = sp_stub.textureset
+    sys.modules["substance_painter.ui"] = sp_stub.ui
+
+
+def test_move_exported_textures_moves_shared_path_once(tmp_path: Path) -> None:
+    _install_qt_stub()
+    _install_sp_stub()
+
+    from axe_usd.dcc.substance_painter import substance_plugin
+
+    export_dir = tmp_path / "export"
+    export_dir.mkdir()
+    shared = export_dir / "shared_Normal.png"
+    shared.write_bytes(b"normal")
+    textures_dir = tmp_path / "Asset" / "textures"
+
+    updated = substance_plugin._move_exported_textures(
+        {("SetA", ""): [str(shared)], ("SetB", ""): [str(shared)]},
+        textures_dir,
+    )
+
+    dest = str(textures_dir / "shared_Normal.png")
+    assert updated == {("SetA", ""): [dest], ("SetB", ""): [dest]}
+    assert not shared.exists()
+    assert Path(dest).read_bytes() == b"normal"
+
+
+def test_move_exported_textures_keeps_newer_destination(tmp_path: Path) -> None:
+    _install_qt_stub()
+    _install_sp_stub()
+
+    from axe_usd.dcc.substance_painter import substance_plugin
+
+    textures_dir = tmp_path / "textures"
+    textures_dir.mkdir()
+    src = tmp_path / "Body_BaseColor.png"
+    src.write_bytes(b"old")
+    dest = textures_dir / "Body_BaseColor.png"
+    dest.write_bytes(b"new")
+    os.utime(src, (1_000, 1_000))
+
+    updated = substance_plugin._move_exported_textures(
+        {("Body", ""): [str(src)]}, textures_dir
+    )
+
+    assert updated == {("Body", ""): [str(dest)]}
+    assert not src.exists()
+    assert dest.read_bytes() == b"new"
+
+
+def test_move_exported_textures_replaces_older_destination(tmp_path: Path) -> None:
+    _install_qt_stub()
+    _install_sp_stub()
+
+    from axe_usd.dcc.substance_painter import substance_plugin
+
+    textures_dir = tmp_path / "textures"
+    textures_dir.mkdir()
+    src = tmp_path / "Body_BaseColor.png"
+    src.write_bytes(b"new")
+    dest = textures_dir / "Body_BaseColor.png"
+    dest.write_bytes(b"old")
+    os.utime(dest, (1_000, 1_000))
+
+    substance_plugin._move_exported_textures({("Body", ""): [str(src)]}, textures_dir)
+
+    assert not src.exists()
+    assert dest.read_bytes() == b"new"
+
+
+def test_move_exported_textures_rejects_missing_file(tmp_path: Path) -> None:
+    _install_qt_stub()
+    _install_sp_stub()
+
+    from axe_usd.dcc.substance_painter import substance_plugin
+
+    with pytest.raises(ValidationError, match="Exported texture file missing"):
+        substance_plugin._move_exported_textures(
+            {("Body", ""): [str(tmp_path / "missing.png")]}, tmp_path / "textures"
+        )
+
+
+def test_move_exported_textures_keeps_destination_errors(
+    monkeypatch, tmp_path: Path
+) -> None:
+    _install_qt_stub()
+    _install_sp_stub()
+
+    from axe_usd.dcc.substance_painter import substance_plugin
+
+    textures_dir = tmp_path / "textures"
+    dest = textures_dir / "Body_BaseColor.png"
+
+    def _missing_dest(src, target):
+        raise FileNotFoundError(errno.ENOENT, "No such file or directory", str(target))
+
+    monkeypatch.setattr(substance_plugin.os, "replace", _missing_dest)
+    src = tmp_path / "Body_BaseColor.png"
+    src.write_bytes(b"color")
+
+    with pytest.raises(FileNotFoundError) as exc_info:
+        substance_plugin._move_exported_textures(
+            {("Body", ""): [str(src)]}, textures_dir
+        )
+
+    assert exc_info.value.filename == str(dest)
+    assert src.exists()
+
+
+class _FakeTextureSet:
+    def __init__(self, name: str, mesh_names) -> None:
+        self._name = name
+        self._mesh_names = mesh_names
+
+    def name(self) -> str:
+        return self._name
+
+    def all_mesh_names(self):
+        return self._mesh_names
+
+
+def test_collect_mesh_name_map_dedupes_in_order(monkeypatch) -> None:
+    _install_qt_stub()
+    _install_sp_stub()
+
+    from axe_usd.dcc.substance_painter import substance_plugin
+
+    texture_sets = [
+        _FakeTextureSet("Body", ["body_geo", "", "arm_geo", "body_geo"]),
+        _FakeTextureSet("Unused", ["unused_geo"]),
+    ]
+    monkeypatch.setattr(
+        substance_plugin.substance_painter.textureset,
+        "all_texture_sets",
+        lambda: texture_sets,
+        raising=False,
+    )
+
+    assert substance_plugin._collect_mesh_name_map(["Body"]) == {
+        "Body": ["body_geo", "arm_geo"]
+    }
+
+
+class _FakeProgressDialog:
+    def __init__(self, label, cancel_text, minimum, maximum, parent) -> None:
+        self.maximum = maximum
+        self.values = []
+        self.labels = []
+        self.modality = None
+        self.closed = False
+        self.deleted = False
+
+    def setWindowTitle(self, title) -> None:
+        pass
+
+    def setCancelButton(self, button) -> None:
+        pass
+
+    def setWindowModality(self, modality) -> None:
+        self.modality = modality
+
+    def setMinimumDuration(self, duration) -> None:
+        pass
+
+    def setLabelText(self, label) -> None:
+        self.labels.append(label)
+
+    def setValue(self, value) -> None:
+        self.values.append(value)
+
+    def close(self) -> None:
+        self.closed = True
+
+    def deleteLater(self) -> None:
+        assert self.closed
+        self.deleted = True
+
+
+def test_export_progress_reports_phases_and_closes(monkeypatch) -> None:
+    _install_qt_stub()
+    _install_sp_stub()
+    from axe_usd.dcc.substance_painter import substance_plugin
+
+    dialogs = []
+
+    def _make_dialog(*args):
+        dialog = _FakeProgressDialog(*args)
+        dialogs.append(dialog)
+        return dialog
+
+    monkeypatch.setattr(substance_plugin, "QProgressDialog", _make_dialog)
+    monkeypatch.setattr(
+        substance_plugin,
+        "Qt",
+        types.SimpleNamespace(ApplicationModal="application"),
+        raising=False,
+    )
+
+    with pytest.raises(ValidationError):
+        with substance_plugin._export_progress(None, 2) as advance:
+            advance("Moving exported textures...")
+            advance("Reading texture sets...")
+            raise ValidationError("No recognized textures were found.")
+
+    (dialog,) = dialogs
+    assert dialog.maximum == 2
+    assert dialog.values == [0, 1]
+    assert dialog.labels == ["Moving exported textures...", "Reading texture sets..."]
+    assert dialog.modality == "application"
+    assert dialog.closed is True
+    assert dialog.deleted is True
+
+
+@pytest.mark.parametrize("usdpreview", [False, True])
+@pytest.mark.parametrize("save_geometry", [False, True])
+def test_on_post_export_advances_progress_once_per_step(
+    monkeypatch, tmp_path: Path, usdpreview: bool, save_geometry: bool
+) -> None:
+    _install_qt_stub()
+    _install_sp_stub()
+    from contextlib import contextmanager
+
+    from axe_usd.dcc.substance_painter import substance_plugin
+
+    progress = {}
+
+    @contextmanager
+    def _record_progress(parent, steps):
+        progress["steps"] = steps
+        progress["labels"] = []
+        yield progress["labels"].append
+
+    class _FakeMeshExporter:
+        def __init__(self, settings) -> None:
+            self.last_error = None
+
+        def export_mesh(self) -> str:
+            return str(tmp_path / "geo.usdc")
+
+    messages = []
+    dialog = types.SimpleNamespace(
+        get_settings=lambda: types.SimpleNamespace(
+            usdpreview=usdpreview,
+            usdpreview_resolution=1024,
+            arnold=False,
+            materialx=False,
+            openpbr=False,
+            arnold_displacement_mode="bump",
+            save_geometry=save_geometry,
+            texture_format_overrides={},
+            log_level="Unknown",
+        ),
+        show_message=lambda icon, title, text: messages.append((icon, text)),
+    )
+    monkeypatch.setattr(substance_plugin, "usd_exported_qdialog", dialog)
+    monkeypatch.setattr(
+        substance_plugin,
+        "QMessageBox",
+        types.SimpleNamespace(Information="info", Critical="critical"),
+    )
+    monkeypatch.setattr(substance_plugin, "_export_progress", _record_progress)
+    monkeypatch.setattr(
+        substance_plugin, "_move_exported_textures", lambda textures, _: textures
+    )
+    monkeypatch.setattr(substance_plugin, "_collect_mesh_name_map", lambda _: {})
+    monkeypatch.setattr(
+        substance_plugin,
+        "parse_textures",
+        lambda textures, mesh_name_map: [
+            types.SimpleNamespace(name="Body", udim_slots=())
+        ],
+    )
+    monkeypatch.setattr(
+        substance_plugin, "_export_usdpreview_textures", lambda *a, **k: None
+    )
+    monkeypatch.setattr(substance_plugin, "MeshExporter", _FakeMeshExporter)
+    monkeypatch.setattr(substance_plugin, "export_publish", lambda *args: None)
+    context = types.SimpleNamespace(
+        textures={("Body", ""): [str(tmp_path / "Body_BaseColor.png")]}
+    )
+
+    substance_plugin.on_post_export(context)
+
+    ((icon, _),) = messages
+    assert icon == "info"
+    assert len(progress["labels"]) == progress["steps"]
+
+
+def test_collect_texture_set_names_dedupes_in_order() -> None:
+    _install_qt_stub()
+    _install_sp_stub()
+    from axe_usd.dcc.substance_painter import substance_plugin
+
+    textures = {
+        ("Body", "Main"): [],
+        ("Head", ""): [],
+        ("Body", "Detail"): [],
+        ("", ""): [],
+        "Legacy": [],
+    }
+
+    assert substance_plugin._collect_texture_set_names(textures) == [
+        "Body",
+        "Head",
+        "Legacy",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("tessellated", "triangulated", "expected", "queries"),
+    [
+        (True, False, "TessellationNormalsBaseMesh", ["tessellation"]),
+        (False, True, "BaseMesh", ["tessellation", "triangulated"]),
+        (False, False, "TriangulatedMesh", ["tessellation", "triangulated"]),
+    ],
+)
+def test_select_mesh_export_option(
+    monkeypatch, tessellated: bool, triangulated: bool, expected: str, queries
+) -> None:
+    _install_qt_stub()
+    _install_sp_stub()
+    from axe_usd.dcc.substance_painter import substance_plugin
+
+    calls = []
+
+    def _has_tessellation() -> bool:
+        calls.append("tessellation")
+        return tessellated
+
+    def _is_triangulated() -> bool:
+        calls.append("triangulated")
+        return triangulated
+
+    export_module = substance_plugin.substance_painter.export
+    monkeypatch.setattr(
+        export_module,
+        "MeshExportOption",
+        types.SimpleNamespace(
+            BaseMesh="BaseMesh",
+            TriangulatedMesh="TriangulatedMesh",
+            TessellationNormalsBaseMesh="TessellationNormalsBaseMesh",
+        ),
+        raising=False,
+    )
+    monkeypatch.setattr(
+        export_module, "scene_has_tessellation", _has_tessellation, raising=False
+    )
+    monkeypatch.setattr(
+        export_module, "scene_is_triangulated", _is_triangulated, raising=False
+    )
+
+    assert substance_plugin._select_mesh_export_option() == expected
+    assert calls == queries
+
+
+def test_move_exported_textures_copies_across_devices(
+    monkeypatch, tmp_path: Path
+) -> None:
+    _install_qt_stub()
+    _install_sp_stub()
+
+    from axe_usd.dcc.substance_painter import substance_plugin
+
+    def _cross_device(src, dest):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(substance_plugin.os, "replace", _cross_device)
+    textures_dir = tmp_path / "textures"
+    src = tmp_path / "Body_BaseColor.png"
+    src.write_bytes(b"color")
+    os.utime(src, (1_000, 1_000))
+
+    substance_plugin._move_exported_textures({("Body", ""): [str(src)]}, textures_dir)
+
+    dest = textures_dir / "Body_BaseColor.png"
+    assert not src.exists()
+    assert dest.read_bytes() == b"color"
+    assert dest.stat().st_mtime == 1_000
+
+
+def test_move_exported_textures_propagates_other_move_errors(
+    monkeypatch, tmp_path: Path
+) -> None:
+    _install_qt_stub()
+    _install_sp_stub()
+
+    from axe_usd.dcc.substance_painter import substance_plugin
+
+    def _denied(src, dest):
+        raise PermissionError(errno.EACCES, "Permission denied")
+
+    def _unexpected_copy(src, dest):
+        raise AssertionError("only cross-device moves should fall back to a copy")
+
+    monkeypatch.setattr(substance_plugin.os, "replace", _denied)
+    monkeypatch.setattr(substance_plugin.shutil, "copy2", _unexpected_copy)
+    textures_dir = tmp_path / "textures"
+    src = tmp_path / "Body_BaseColor.png"
+    src.write_bytes(b"color")
+
+    with pytest.raises(PermissionError):
+        substance_plugin._move_exported_textures(
+            {("Body", ""): [str(src)]}, textures_dir
+        )
+
+    assert src.read_bytes() == b"color"
+    assert not (textures_dir / "Body_BaseColor.png").exists()
+
+
+def test_env_flag_follows_environment_changes(monkeypatch) -> None:
+    _install_qt_stub()
+    _install_sp_stub()
+    from axe_usd.dcc.substance_painter import substance_plugin
+
+    monkeypatch.setenv("AXEUSD_TEST_FLAG", " Yes ")
+    assert substance_plugin._env_flag("AXEUSD_TEST_FLAG") is True
+    monkeypatch.setenv("AXEUSD_TEST_FLAG", "0")
+    assert substance_plugin._env_flag("AXEUSD_TEST_FLAG") is False
+    monkeypatch.delenv("AXEUSD_TEST_FLAG")
+    assert substance_plugin._env_flag("AXEUSD_TEST_FLAG") is False
+
+
+def test_mesh_export_removes_temp_file_when_conversion_fails(
+    monkeypatch, tmp_path: Path
+) -> None:
+    _install_qt_stub()
+    _install_sp_stub()
+    from axe_usd.core.exceptions import USDStageError
+    from axe_usd.core.models import ExportSettings
+    from axe_usd.dcc.substance_painter import substance_plugin
+
+    written = []
+
+    def _export_mesh(path: str, option):
+        Path(path).write_text("#usda 1.0\n", encoding="utf-8")
+        written.append(Path(path))
+        return types.SimpleNamespace(status="ok", message="")
+
+    def _fail_conversion(self, export_path: Path) -> None:
+        raise USDStageError("Failed to open temporary mesh for conversion.")
+
+    export_module = substance_plugin.substance_painter.export
+    monkeypatch.setattr(export_module, "export_mesh", _export_mesh, raising=False)
+    monkeypatch.setattr(
+        export_module,
+        "ExportStatus",
+        types.SimpleNamespace(Success="ok"),
+        raising=False,
+    )
+    monkeypatch.setattr(substance_plugin, "_select_mesh_export_option", lambda: None)
+    monkeypatch.setattr(
+        substance_plugin.MeshExporter, "_convert_to_usdc", _fail_conversion
+    )
+    settings = ExportSettings(
+        usdpreview=True,
+        arnold=False,
+        materialx=False,
+        openpbr=False,
+        primitive_path="/Asset",
+        publish_directory=tmp_path,
+        save_geometry=True,
+    )
+    exporter = substance_plugin.MeshExporter(settings)
+
+    assert exporter.export_mesh() is None
+    assert exporter.last_error == "Failed to open temporary mesh for conversion."
+    assert written and not written[0].exists()
+
+
+def test_verify_export_context_returns_first_texture_folder(monkeypatch) -> None:
+    _install_qt_stub()
+    _install_sp_stub()
+    from axe_usd.dcc.substance_painter import substance_plugin
+
+    monkeypatch.setattr(substance_plugin, "usd_exported_qdialog", object())
+    context = types.SimpleNamespace(
+        textures={
+            ("Body", ""): ["/export/Body_BaseColor.png"],
+            ("Head", ""): ["/other/Head_BaseColor.png"],
+        }
+    )
+
+    assert substance_plugin._verify_export_context(context) == Path("/export")
+
+
+def test_verify_export_context_reports_empty_texture_sets(monkeypatch) -> None:
+    _install_qt_stub()
+    _install_sp_stub()
+    from axe_usd.dcc.substance_painter import substance_plugin
+
+    monkeypatch.setattr(substance_plugin, "usd_exported_qdialog", object())
+    context = types.SimpleNamespace(
+        textures={
+            ("Body", ""): ["/export/Body_BaseColor.png"],
+            ("Head", ""): [],
+            ("Arm", ""): [],
+        }
+    )
+
+    with pytest.raises(ValidationError) as exc_info:
+        substance_plugin._verify_export_context(context)
+
+    assert exc_info.value.details == {"texture_sets": ["Head", "Arm"]}
+
+
+def test_close_plugin_deletes_dock_widget_once(monkeypatch) -> None:
+    _install_qt_stub()
+    _install_sp_stub()
+    from axe_usd.dcc.substance_painter import substance_plugin
+
+    deleted = []
+    dialog = object()
+    monkeypatch.setattr(
+        substance_plugin.substance_painter.ui,
+        "delete_ui_element",
+        deleted.append,
+        raising=False,
+    )
+    monkeypatch.setattr(substance_plugin, "callbacks_registered", False)
+    monkeypatch.setattr(substance_plugin, "usd_exported_qdialog", dialog)
+
+    substance_plugin.close_plugin()
+    substance_plugin.close_plugin()
+
+    assert deleted == [dialog]
+    assert substance_plugin.usd_exported_qdialog is None
+
+
+def test_convert_to_usdc_writes_crate_file(tmp_path: Path) -> None:
+    pytest.importorskip("pxr")
+    _install_qt_stub()
+    _install_sp_stub()
+    from pxr import Sdf
+
+    from axe_usd.core.models import ExportSettings
+    from axe_usd.dcc.substance_painter import substance_plugin
+
+    temp_mesh = tmp_path / "Asset" / "geo.usd"
+    temp_mesh.parent.mkdir()
+    temp_mesh.write_text('#usda 1.0\n\ndef Xform "root"\n{\n}\n', encoding="utf-8")
+    settings = ExportSettings(
+        usdpreview=True,
+        arnold=False,
+        materialx=False,
+        openpbr=False,
+        primitive_path="/Asset",
+        publish_directory=tmp_path,
+        save_geometry=True,
+    )
+    exporter = substance_plugin.MeshExporter(settings)
+
+    exporter._convert_to_usdc(temp_mesh)
+
+    layer = Sdf.Layer.FindOrOpen(str(exporter.mesh_path))
+    assert layer.GetFileFormat().formatId == "usdc"
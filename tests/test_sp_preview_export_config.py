@@ -29,6 +29,7 @@ def _install_qt_stub() -> None:
         "QLabel",
         "QMessageBox",
         "QMenuBar",
+        "QProgressDialog",
         "QPushButton",
         "QScrollArea",
         "QVBoxLayout",
@@ -156,3 +157,109 @@ def test_parse_preview_texture_format_rejects_unsupported_value() -> None:
 
     assert exc_info.value.details["format"] == "tif"
     assert exc_info.value.details["supported_formats"] == ["jpg", "jpeg", "png"]
+
+
+def test_build_preview_export_config_adds_udim_preset() -> None:
+    _install_qt_stub()
+    _install_sp_stub()
+    from axe_usd.dcc.substance_painter import substance_plugin
+
+    config = substance_plugin._build_preview_export_config(
+        preview_dir=Path("C:/tmp/preview"),
+        texture_sets=("Body", "Head"),
+        resolution=512,
+        preview_format=parse_preview_texture_format("png"),
+        udim_texture_sets=("Head",),
+    )
+
+    single, udim = config["exportPresets"]
+    assert single["name"] == substance_plugin.PREVIEW_EXPORT_PRESET
+    assert udim["name"] == substance_plugin.PREVIEW_EXPORT_PRESET_UDIM
+    assert udim["maps"][0]["fileName"] == "$textureSet_BaseColor.$udim"
+    assert udim["maps"][0]["parameters"] == single["maps"][0]["parameters"]
+    assert [c["destChannel"] for c in udim["maps"][0]["channels"]] == ["R", "G", "B"]
+    assert [item["exportPreset"] for item in config["exportList"]] == [
+        substance_plugin.PREVIEW_EXPORT_PRESET,
+        substance_plugin.PREVIEW_EXPORT_PRESET_UDIM,
+    ]
+
+
+@pytest.mark.parametrize(
+    ("textures", "expected"),
+    [
+        ({("Body", ""): ["C:\\export\\previewTextures\\Body_BaseColor.jpg"]}, True),
+        ({("Body", ""): ["/export/PreviewTextures/Body_BaseColor.jpg", ""]}, True),
+        (
+            {
+                ("Body", ""): ["/export/previewTextures/Body_BaseColor.jpg"],
+                ("Head", ""): ["/export/Head_BaseColor.png"],
+            },
+            False,
+        ),
+        ({("Body", ""): ["/export/previewTextures_old/Body_BaseColor.jpg"]}, False),
+        ({("Body", ""): ["previewTextures/Body_BaseColor.jpg"]}, True),
+        ({("Body", ""): [""]}, False),
+        ({}, False),
+    ],
+)
+def test_is_preview_export_context(textures, expected: bool) -> None:
+    _install_qt_stub()
+    _install_sp_stub()
+    from axe_usd.dcc.substance_painter import substance_plugin
+
+    context = types.SimpleNamespace(textures=textures)
+
+    assert substance_plugin._is_preview_export_context(context) is expected
+
+
+def test_build_preview_export_config_dedupes_export_list() -> None:
+    _install_qt_stub()
+    _install_sp_stub()
+    from axe_usd.dcc.substance_painter import substance_plugin
+
+    config = substance_plugin._build_preview_export_config(
+        preview_dir=Path("C:/tmp/preview"),
+        texture_sets=("Body", "", "Head", "Body"),
+        resolution=128,
+        preview_format=parse_preview_texture_format("jpg"),
+    )
+
+    assert [item["rootPath"] for item in config["exportList"]] == ["Body", "Head"]
+
+
+def test_build_preview_export_config_returns_fresh_presets() -> None:
+    _install_qt_stub()
+    _install_sp_stub()
+    from axe_usd.dcc.substance_painter import substance_plugin
+
+    def _build(texture_sets):
+        return substance_plugin._build_preview_export_config(
+            preview_dir=Path("C:/tmp/preview"),
+            texture_sets=texture_sets,
+            resolution=1024,
+            preview_format=parse_preview_texture_format("png"),
+        )
+
+    first = _build(("Body",))
+    second = _build(("Head",))
+
+    first_map = first["exportPresets"][0]["maps"][0]
+    first_map["parameters"]["sizeLog2"] = 7
+    first_map["channels"][0]["srcMapName"] = "roughness"
+
+    second_map = second["exportPresets"][0]["maps"][0]
+    assert second_map["parameters"]["sizeLog2"] == 10
+    assert [channel["srcMapName"] for channel in second_map["channels"]] == [
+        "baseColor",
+        "baseColor",
+        "baseColor",
+    ]
+    assert _build(("Body",))["exportPresets"][0]["maps"][0]["channels"][0] == {
+        "destChannel": "R",
+        "srcChannel": "R",
+        "srcMapType": "documentMap",
+        "srcMapName": "baseColor",
+    }
+    assert second["exportList"] == [
+        {"rootPath": "Head", "exportPreset": substance_plugin.PREVIEW_EXPORT_PRESET}
+    ]
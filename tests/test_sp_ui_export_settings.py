@@ -1,6 +1,9 @@
+import dataclasses
 import sys
 import types
 
+import pytest
+
 
 def _install_qt_stub() -> None:
     if "axe_usd.dcc.substance_painter.qt_compat" in sys.modules:
@@ -23,6 +26,7 @@ def _install_qt_stub() -> None:
         "QLabel",
         "QMessageBox",
         "QMenuBar",
+        "QProgressDialog",
         "QPushButton",
         "QScrollArea",
         "QVBoxLayout",
@@ -104,3 +108,71 @@ def test_arnold_displacement_toggle_maps_to_export_settings():
         texture_overrides=settings.texture_format_overrides,
     )
     assert export_settings.arnold_displacement_mode == "displacement"
+
+
+def test_usd_settings_is_read_only():
+    _install_qt_stub()
+    _install_sp_stub()
+
+    from axe_usd.dcc.substance_painter import ui
+
+    settings = ui.USDSettings(
+        usdpreview=True,
+        arnold=False,
+        materialx=True,
+        save_geometry=True,
+        openpbr=False,
+        arnold_displacement_mode="bump",
+        usdpreview_resolution=128,
+        texture_format_overrides={},
+        log_level="Debug",
+    )
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        settings.arnold = True
+
+
+class _FakeMessageBox:
+    Ok = "ok"
+    created = []
+
+    def __init__(self, parent) -> None:
+        self.parent = parent
+        self.texts = []
+        self.runs = 0
+        _FakeMessageBox.created.append(self)
+
+    def setIcon(self, icon) -> None:
+        self.icon = icon
+
+    def setStandardButtons(self, buttons) -> None:
+        pass
+
+    def setWindowTitle(self, title) -> None:
+        self.title = title
+
+    def setText(self, text) -> None:
+        self.texts.append(text)
+
+    def exec_(self) -> int:
+        self.runs += 1
+        return 0
+
+
+def test_show_message_reuses_one_box_per_icon(monkeypatch):
+    _install_qt_stub()
+    _install_sp_stub()
+
+    from axe_usd.dcc.substance_painter import ui
+
+    monkeypatch.setattr(ui, "QMessageBox", _FakeMessageBox)
+    monkeypatch.setattr(_FakeMessageBox, "created", [])
+    fake_view = types.SimpleNamespace(_message_boxes={})
+
+    ui.USDExporterView.show_message(fake_view, "critical", "USD Exporter", "first")
+    ui.USDExporterView.show_message(fake_view, "critical", "USD Exporter", "second")
+    ui.USDExporterView.show_message(fake_view, "info", "USD Exporter", "done")
+
+    critical, info = _FakeMessageBox.created
+    assert critical.texts == ["first", "second"]
+    assert critical.runs == 2
+    assert info.icon == "info"
@@ -9,3 +9,8 @@ def test_slot_from_path_ao_matches_token():
 def test_slot_from_path_ao_not_substring():
     """Ensure substring collisions do not match slots."""
     assert slot_from_path("C:/tex/chaos.png") is None
+
+
+def test_slot_from_path_keeps_token_priority():
+    """Ensure earlier tokens win when several slot tokens are present."""
+    assert slot_from_path("C:/tex/Mat_Normal_Roughness.png") == "roughness"
@@ -107,6 +107,20 @@ def test_parse_textures_includes_mesh_names():
     assert bundle.mesh_names == ("Mesh_A", "Mesh_A_1")
 
 
+def test_parse_textures_dedupes_mesh_names_in_order():
+    """Duplicate and empty mesh names are dropped, keeping first-seen order."""
+    textures = {
+        ("Mat_Assigned", ""): [
+            "C:/tex/Mat_Assigned_BaseColor.png",
+        ],
+    }
+    mesh_map = {"Mat_Assigned": ["Mesh_B", "", "Mesh_A", "Mesh_B", "Mesh_A"]}
+
+    bundles = parse_textures(textures, mesh_name_map=mesh_map)
+
+    assert bundles[0].mesh_names == ("Mesh_B", "Mesh_A")
+
+
 def test_parse_textures_udim_tokens_single_tile():
     """UDIM tiles should be normalized to <UDIM> even if only one tile exists."""
     textures = {
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import compileall
 import json
 import os
 from pathlib import Path
+import py_compile
+import re
 import shutil
 import subprocess
 import sys
@@ -232,6 +235,20 @@ def _copy_plugin_sources(plugin_dist: Path) -> None:
     shutil.copytree(PACKAGE_SRC, plugin_dist / "axe_usd", ignore=IGNORE_PATTERNS)
 
 
+def _precompile_plugin_sources(plugin_dist: Path) -> None:
+    # Ship __pycache__ bytecode for the build interpreter so the matching
+    # Substance Painter Python can skip compiling plugin sources on cold start.
+    # Hash-based pycs stay valid even if extraction changes file mtimes.
+    ok = compileall.compile_dir(
+        str(plugin_dist),
+        quiet=1,
+        rx=re.compile(r"[\\/]dependencies[\\/]"),
+        invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH,
+    )
+    if not ok:
+        raise SystemExit(f"Failed to byte-compile plugin sources in {plugin_dist}")
+
+
 def _write_version_file(plugin_dist: Path) -> None:
     version = _read_project_version()
     if version is None:
@@ -248,6 +265,7 @@ def build_plugin_bundle() -> Path:
     _copy_plugin_sources(plugin_dist)
     _populate_usd_dependencies(plugin_dist)
     _write_version_file(plugin_dist)
+    _precompile_plugin_sources(plugin_dist)
 
     zip_path = DIST_DIR / "axe_usd_plugin.zip"
     _zip_plugin(plugin_dist, zip_path)